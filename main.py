@@ -1,22 +1,115 @@
 import os
+import re
+import sys
+import atexit
+import queue
 import logging
+import logging.handlers
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
 from typing import Dict, List
-from nemoguardrails import RailsConfig, LLMRails
-from nemoguardrails.integrations.langchain.runnable_rails import RunnableRails
-from groq import Groq
 import asyncio
 import json
 from datetime import datetime
-from dotenv import load_dotenv
-import yaml
 
-# Load environment variables from .env file
-load_dotenv()
+# Heavy third-party imports (nemoguardrails, groq, yaml, dotenv, onnxruntime)
+# are deferred to first use so the CLI starts fast and fails fast.
+
+def load_env():
+    """Load environment variables from the .env file."""
+    from dotenv import load_dotenv
+    load_dotenv()
+
+def _check_onnxruntime():
+    """Warn if onnxruntime (used for embeddings) is missing or fails to load."""
+    try:
+        import onnxruntime
+    except ImportError as e:
+        logger.warning("onnxruntime is not installed or failed to load. Some advanced features (like embeddings) may not work. To fix, install onnxruntime and the Microsoft Visual C++ Redistributable.")
+        logger.warning(f"onnxruntime ImportError: {e}")
+
+class BatchingFileHandler(logging.FileHandler):
+    """
+    File handler that buffers records and writes them in batches.
+    
+    The buffer is written once it grows past `max_buffer_bytes`, or when
+    `flush()` is called (the BatchingQueueListener does so whenever its
+    queue runs empty).
+    """
+    
+    def __init__(self, filename: str, max_buffer_bytes: int = 64 * 1024, **kwargs):
+        super().__init__(filename, **kwargs)
+        self.max_buffer_bytes = max_buffer_bytes
+        self._buffer = []  # (formatted message, record) pairs
+        self._buffer_bytes = 0
+    
+    def emit(self, record: logging.LogRecord):
+        try:
+            msg = self.format(record) + self.terminator
+        except Exception:
+            self.handleError(record)
+            return
+        with self.lock:
+            self._buffer.append((msg, record))
+            self._buffer_bytes += len(msg)
+            if self._buffer_bytes >= self.max_buffer_bytes:
+                self._write_buffer()
+    
+    def _write_buffer(self):
+        """Write out buffered records. Caller must hold the handler lock."""
+        if not self._buffer or self.stream is None:
+            return
+        try:
+            self.stream.write("".join(msg for msg, _ in self._buffer))
+            self.stream.flush()
+        except Exception:
+            # Retry record by record so only the ones that fail are lost
+            for msg, record in self._buffer:
+                try:
+                    self.stream.write(msg)
+                except Exception:
+                    self.handleError(record)
+            try:
+                self.stream.flush()
+            except Exception:
+                self.handleError(self._buffer[-1][1])
+        finally:
+            # Drop the batch either way so one bad record can't wedge the handler
+            self._buffer.clear()
+            self._buffer_bytes = 0
+    
+    def flush(self):
+        with self.lock:
+            self._write_buffer()
+    
+    def close(self):
+        self.flush()
+        super().close()
+
+class BatchingQueueListener(logging.handlers.QueueListener):
+    """Queue listener that flushes its handlers each time the queue drains."""
+    
+    def dequeue(self, block: bool):
+        if block and self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+        return super().dequeue(block)
 
 # Configure logging
-file_handler = logging.FileHandler('guardrail_logs.log')
+# File writes happen on a background listener thread so chat turns never
+# wait on disk I/O. Records arrive pre-formatted from the QueueHandler.
+# UTF-8 regardless of locale (e.g. cp1252 on Windows) since interaction
+# entries carry raw non-ASCII text; lone surrogates are backslash-escaped
+file_handler = BatchingFileHandler('guardrail_logs.log', encoding='utf-8', errors='backslashreplace')
 file_handler.setLevel(logging.INFO)
 
+log_queue = queue.Queue(-1)
+queue_handler = logging.handlers.QueueHandler(log_queue)
+queue_handler.setLevel(logging.INFO)
+queue_listener = BatchingQueueListener(log_queue, file_handler, respect_handler_level=True)
+queue_listener.start()
+atexit.register(queue_listener.stop)
+
 stream_handler = logging.StreamHandler()
 stream_handler.setLevel(logging.WARNING)
 
@@ -24,18 +117,132 @@ logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        file_handler,
+        queue_handler,
         stream_handler
     ]
 )
 logger = logging.getLogger(__name__)
 
 try:
-    import onnxruntime
-except ImportError as e:
-    logger = logging.getLogger(__name__)
-    logger.warning("onnxruntime is not installed or failed to load. Some advanced features (like embeddings) may not work. To fix, install onnxruntime and the Microsoft Visual C++ Redistributable.")
-    logger.warning(f"onnxruntime ImportError: {e}")
+    from cyac import AC
+except ImportError:
+    AC = None
+    logger.info("cyac is not installed; falling back to regex keyword matching.")
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def dumps_compact(obj) -> str:
+    """Serialize to compact single-line JSON, using orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode()
+        except orjson.JSONEncodeError:
+            # e.g. lone surrogates, which orjson rejects
+            pass
+    # ensure_ascii=False matches orjson's raw UTF-8 output
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+
+# Response quality signals, compiled once and matched without lower-casing
+_CITATION_RE = re.compile(r"Source:|(?i:according to)|http|www\.")
+_UNSAFE_RE = re.compile(r"illegal|harmful|violence", re.IGNORECASE)
+
+class FilterEngine:
+    """
+    Classifies user input against the topic and toxicity keyword filters.
+    
+    All keywords are compiled once into a single matcher so one pass over the
+    input finds the first keyword of either category. `matcher` selects it:
+    "cyac" (an Aho-Corasick automaton, which scans a lower-cased copy of the
+    input), "regex" (a case-insensitive alternation that scans the input in
+    place, with no copy), or "auto" (cyac when installed, otherwise regex).
+    """
+    
+    __slots__ = ("max_length", "_scan")
+    
+    def __init__(self, topic_keywords, toxic_keywords, max_length: int = 1000,
+                 matcher: str = "auto"):
+        if matcher not in ("auto", "cyac", "regex"):
+            raise ValueError(f"Unknown keyword matcher: {matcher}")
+        if matcher == "cyac" and AC is None:
+            raise ValueError("Keyword matcher 'cyac' requested but cyac is not installed")
+        self.max_length = max_length
+        # Keyword -> category; a keyword listed in both keeps the topic category.
+        # Empty keywords are dropped: they would match everything, and cyac
+        # does not assign them an id.
+        category_of = {}
+        for keyword in topic_keywords:
+            if keyword:
+                category_of.setdefault(keyword.lower(), "restricted_topic")
+        for keyword in toxic_keywords:
+            if keyword:
+                category_of.setdefault(keyword.lower(), "potentially_toxic")
+        use_automaton = AC is not None and matcher != "regex"
+        self._scan = self._build_scan(category_of, use_automaton)
+    
+    @staticmethod
+    def _build_scan(category_of, use_automaton: bool):
+        """
+        Compile the keywords into a scan function.
+        
+        The backend is chosen here, once, so the returned function takes the
+        input text and directly returns the category of the first keyword
+        found, or None.
+        """
+        if not category_of:
+            return lambda text: None
+        
+        if use_automaton:
+            # Automaton pattern ids follow insertion order of the unique keywords
+            match = AC.build(list(category_of)).match
+            category_of_id = tuple(category_of.values())
+            
+            def scan_automaton(text: str):
+                # The automaton is case-sensitive, so it scans a lower-cased copy
+                # (cyac's ignore_case mode lower-cases internally and remaps
+                # offsets, which costs more than lowering the input here).
+                # Matches come out in end-offset order; to agree with the regex
+                # matcher, the leftmost start wins, then the longest keyword.
+                best_id = best_start = best_end = None
+                for id_, start, end in match(text.lower()):
+                    if best_id is None or start < best_start or (start == best_start and end > best_end):
+                        best_id, best_start, best_end = id_, start, end
+                return None if best_id is None else category_of_id[best_id]
+            
+            return scan_automaton
+        
+        # Longest first so overlapping keywords prefer the longer match. Each
+        # keyword is its own group, so match.lastindex identifies it without
+        # looking the matched text back up.
+        keywords = sorted(category_of, key=len, reverse=True)
+        search = re.compile(
+            '|'.join(f"({re.escape(keyword)})" for keyword in keywords), re.IGNORECASE
+        ).search
+        category_of_group = (None,) + tuple(category_of[keyword] for keyword in keywords)
+        
+        def scan_regex(text: str):
+            match = search(text)
+            return category_of_group[match.lastindex] if match else None
+        
+        return scan_regex
+    
+    def classify(self, user_input: str) -> str:
+        """
+        Classify the input.
+        
+        Returns one of "safe", "empty_input", "input_too_long",
+        "restricted_topic" or "potentially_toxic".
+        """
+        # Basic input validation
+        if not user_input or user_input.isspace():
+            return "empty_input"
+        if len(user_input) > self.max_length:
+            return "input_too_long"
+        # Topic and toxicity keywords in a single case-insensitive pass; the
+        # first hit wins
+        return self._scan(user_input) or "safe"
 
 class GuardrailChatBot:
     """
@@ -51,20 +258,64 @@ class GuardrailChatBot:
             groq_api_key: API key for ChatGroq
             config_path: Path to the guardrail configuration file
         """
+        from groq import Groq
+        
         self.groq_api_key = groq_api_key
         self.config_path = config_path
         self.groq_client = Groq(api_key=groq_api_key)
         self.rails = None
-        self.conversation_history = []
+        # Conversation history per session, so one bot can serve many clients.
+        # Each history keeps only the most recent HISTORY_MAX exchanges, and
+        # only the SESSIONS_MAX most recently active sessions are kept.
+        self.history_max = int(os.getenv("HISTORY_MAX", 200))
+        self.sessions_max = int(os.getenv("SESSIONS_MAX", 1000))
+        self.conversation_histories: "OrderedDict[str, deque]" = OrderedDict()
         
         # Set up OpenAI client for NeMo (using Groq endpoint)
         os.environ["OPENAI_API_KEY"] = groq_api_key
         os.environ["OPENAI_API_BASE"] = "https://api.groq.com/openai/v1"
         
         self._initialize_rails()
+        self.reload_filters()
+    
+    @classmethod
+    async def create(cls, groq_api_key: str, config_path: str = "config.yml",
+                     warmup: bool = True) -> "GuardrailChatBot":
+        """
+        Create a chatbot without blocking the event loop.
+        
+        Loading the rails config and LLMRails can take seconds, so the
+        constructor runs in a worker thread, then the bot is warmed up.
+        
+        Args:
+            groq_api_key: API key for ChatGroq
+            config_path: Path to the guardrail configuration file
+            warmup: Whether to warm up the rails before returning
+        """
+        bot = await asyncio.to_thread(cls, groq_api_key, config_path)
+        if warmup:
+            await bot.warmup()
+        return bot
+    
+    async def warmup(self):
+        """
+        Send a throwaway message through the rails.
+        
+        NeMo lazily loads some components on the first generation; doing it
+        here keeps that cost off the first real user request.
+        """
+        try:
+            await self.rails.generate_async(messages=[{"role": "user", "content": "ping"}])
+            logger.info("Guardrails warmed up")
+        except Exception as e:
+            logger.warning(f"Guardrails warm-up failed: {str(e)}")
         
     def _initialize_rails(self):
         """Initialize the NeMo Guardrails system."""
+        from nemoguardrails import RailsConfig, LLMRails
+        
+        _check_onnxruntime()
+        
         try:
             # Load the guardrail configuration
             config = RailsConfig.from_path(self.config_path)
@@ -83,59 +334,59 @@ class GuardrailChatBot:
         except Exception as e:
             logger.error(f"Failed to initialize guardrails: {str(e)}")
             raise
+
+    def reload_filters(self):
+        """Load the keyword filters from the config file and cache them."""
+        import yaml
+        
+        with open(self.config_path, 'r') as f:
+            config = yaml.safe_load(f) or {}
+        filters = config.get('filters', {})
+        self._topic_keywords = tuple(filters.get('topic_keywords', []))
+        self._toxic_keywords = tuple(filters.get('toxic_keywords', []))
+        self._filter = FilterEngine(
+            self._topic_keywords, self._toxic_keywords,
+            matcher=filters.get('matcher', 'auto')
+        )
+        logger.info("Input filters loaded")
     
     def _log_interaction(self, user_input: str, bot_response: str, 
                         guardrail_triggered: bool = False, 
-                        guardrail_type: str = None):
+                        guardrail_type: str = None, timestamp: str = None):
         """Log the interaction for monitoring and debugging."""
         log_entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp or datetime.now().isoformat(),
             "user_input": user_input,
             "bot_response": bot_response,
             "guardrail_triggered": guardrail_triggered,
             "guardrail_type": guardrail_type
         }
         
-        logger.info(f"Interaction logged: {json.dumps(log_entry, indent=2)}")
+        logger.info(f"Interaction logged: {dumps_compact(log_entry)}")
     
     def _preprocess_input(self, user_input: str) -> str:
         """Preprocess user input for additional safety checks."""
-        # Load filters from config file
-        with open(self.config_path, 'r') as f:
-            config = yaml.safe_load(f)
-        filters = config.get('filters', {})
-        topic_keywords = filters.get('topic_keywords', [])
-        toxic_keywords = filters.get('toxic_keywords', [])
-        # Basic input validation
-        if len(user_input.strip()) == 0:
-            return "empty_input"
-        if len(user_input) > 1000:
-            return "input_too_long"
-        lower_input = user_input.lower()
-        # Topic restriction keywords
-        if any(keyword in lower_input for keyword in topic_keywords):
-            return "restricted_topic"
-        # Toxicity filter
-        if any(keyword in lower_input for keyword in toxic_keywords):
-            return "potentially_toxic"
-        return "safe"
+        return self._filter.classify(user_input)
 
     def _check_response_quality(self, response: str) -> Dict[str, any]:
         """Check if the response meets quality standards."""
+        response_length = len(response)
         quality_check = {
-            "length_appropriate": len(response) <= 500,
-            "has_citations": ("Source:" in response or "according to" in response.lower() or "http" in response or "www." in response),
-            "is_helpful": len(response.strip()) > 10,
-            "is_safe": not any(word in response.lower() for word in ["illegal", "harmful", "violence"])
+            "length": response_length,
+            "length_appropriate": response_length <= 500,
+            "has_citations": _CITATION_RE.search(response) is not None,
+            "is_helpful": response_length > 10 and len(response.strip()) > 10,
+            "is_safe": _UNSAFE_RE.search(response) is None
         }
         return quality_check
 
-    async def chat(self, user_input: str) -> str:
+    async def chat(self, user_input: str, session_id: str = "default") -> str:
         """
         Process user input through guardrails and generate response.
         
         Args:
             user_input: The user's message
+            session_id: Identifier of the conversation the message belongs to
             
         Returns:
             Bot response after guardrail processing
@@ -169,23 +420,26 @@ class GuardrailChatBot:
             # Check response quality
             quality_check = self._check_response_quality(bot_response)
             
-            # Response length control
+            # Response length is capped by max_tokens in the model config
             if not quality_check["length_appropriate"]:
-                bot_response = bot_response[:500] + "... (Response truncated for brevity)"
+                logger.info(f"Response exceeded 500 characters ({quality_check['length']})")
             
             # Citation enforcement
             if not quality_check["has_citations"]:
                 bot_response += "\n\n(Note: Please provide sources or citations for external information.)"
             
+            # One timestamp for both the history entry and the log entry
+            timestamp = datetime.now().isoformat()
+            
             # Add conversation to history
-            self.conversation_history.append({
+            self._session_history(session_id).append({
                 "user": user_input,
                 "bot": bot_response,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             })
             
             # Log the interaction
-            self._log_interaction(user_input, bot_response)
+            self._log_interaction(user_input, bot_response, timestamp=timestamp)
             
             return bot_response
             
@@ -193,17 +447,142 @@ class GuardrailChatBot:
             logger.error(f"Error in chat processing: {str(e)}")
             return "I'm sorry, I encountered an error while processing your request. Please try again."
     
-    def get_conversation_history(self) -> List[Dict]:
-        """Return the conversation history."""
-        return self.conversation_history
+    def _session_history(self, session_id: str) -> deque:
+        """Return the history of a session, evicting the least recently used one if needed."""
+        history = self.conversation_histories.get(session_id)
+        if history is None:
+            history = self.conversation_histories[session_id] = deque(maxlen=self.history_max)
+            if len(self.conversation_histories) > self.sessions_max:
+                self.conversation_histories.popitem(last=False)
+        else:
+            self.conversation_histories.move_to_end(session_id)
+        return history
+    
+    def get_conversation_history(self, session_id: str = "default") -> List[Dict]:
+        """Return a snapshot of the conversation history of a session."""
+        return list(self.conversation_histories.get(session_id, ()))
+    
+    def clear_history(self, session_id: str = "default"):
+        """Clear the conversation history of a session."""
+        self.conversation_histories.pop(session_id, None)
+        logger.info(f"Conversation history cleared for session {session_id}")
+
+class ChatRequestQueue:
+    """
+    Bounded request queue that shares one chatbot between concurrent clients.
+    
+    A fixed pool of worker coroutines pulls requests off the queue, so up to
+    `max_concurrency` LLM calls are in flight at once.
+    """
+    
+    def __init__(self, bot: GuardrailChatBot, max_concurrency: int = 4, max_queue_size: int = 100):
+        """
+        Initialize the request queue.
+        
+        Args:
+            bot: The chatbot that serves every request
+            max_concurrency: Number of worker coroutines
+            max_queue_size: Maximum number of requests waiting for a worker
+        """
+        self.bot = bot
+        self.max_concurrency = max_concurrency
+        self.queue = asyncio.Queue(maxsize=max_queue_size)
+        self._workers = []
+    
+    def start(self):
+        """Start the worker coroutines on the running event loop."""
+        self._workers = [
+            asyncio.create_task(self._worker()) for _ in range(self.max_concurrency)
+        ]
+        logger.info(f"Started {self.max_concurrency} chat workers")
+    
+    async def stop(self):
+        """Cancel the worker coroutines."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+    
+    async def submit(self, user_input: str, session_id: str = "default") -> str:
+        """
+        Enqueue a message and wait for the bot's response.
+        
+        Raises:
+            asyncio.QueueFull: If the queue is at capacity
+        """
+        future = asyncio.get_running_loop().create_future()
+        self.queue.put_nowait((user_input, session_id, future))
+        return await future
+    
+    async def _worker(self):
+        """Serve queued requests until cancelled."""
+        while True:
+            user_input, session_id, future = await self.queue.get()
+            try:
+                if not future.cancelled():
+                    response = await self.bot.chat(user_input, session_id)
+                    if not future.cancelled():
+                        future.set_result(response)
+            except Exception as e:
+                if not future.cancelled():
+                    future.set_exception(e)
+            finally:
+                self.queue.task_done()
+
+def create_app(bot: GuardrailChatBot = None, max_concurrency: int = None):
+    """
+    Create a FastAPI app that serves the chatbot over HTTP.
+    
+    Run with: uvicorn main:create_app --factory
+    
+    Args:
+        bot: The chatbot to serve; created and warmed up at startup from GROQ_API_KEY if not given
+        max_concurrency: Number of concurrent LLM calls (default: CHAT_MAX_CONCURRENCY or 4)
+    """
+    from fastapi import FastAPI, HTTPException
+    from pydantic import BaseModel
+    
+    load_env()
+    groq_api_key = os.getenv("GROQ_API_KEY")
+    if bot is None and not groq_api_key:
+        raise ValueError("Please set the GROQ_API_KEY environment variable")
+    if max_concurrency is None:
+        max_concurrency = int(os.getenv("CHAT_MAX_CONCURRENCY", 4))
+    
+    request_queue = ChatRequestQueue(bot, max_concurrency=max_concurrency)
+    
+    @asynccontextmanager
+    async def lifespan(app):
+        if request_queue.bot is None:
+            request_queue.bot = await GuardrailChatBot.create(groq_api_key)
+        request_queue.start()
+        yield
+        await request_queue.stop()
+    
+    class ChatRequest(BaseModel):
+        message: str
+        session_id: str = "default"
     
-    def clear_history(self):
-        """Clear the conversation history."""
-        self.conversation_history = []
-        logger.info("Conversation history cleared")
+    app = FastAPI(title="NeMo Guardrails Chatbot", lifespan=lifespan)
+    
+    @app.post("/chat")
+    async def chat(request: ChatRequest):
+        try:
+            response = await request_queue.submit(request.message, request.session_id)
+        except asyncio.QueueFull:
+            raise HTTPException(status_code=503, detail="Server is busy, please retry shortly")
+        return {"response": response, "session_id": request.session_id}
+    
+    return app
 
-def run_test_scenarios(bot: GuardrailChatBot):
-    """Run test scenarios to validate guardrail functionality."""
+async def run_test_scenarios(bot: GuardrailChatBot, max_concurrency: int = 4):
+    """
+    Run test scenarios to validate guardrail functionality.
+    
+    Args:
+        bot: The chatbot to test
+        max_concurrency: Maximum number of test cases in flight at once
+    """
     test_cases = [
         # Normal queries
         "What is artificial intelligence?",
@@ -233,20 +612,128 @@ def run_test_scenarios(bot: GuardrailChatBot):
     print("RUNNING GUARDRAIL TEST SCENARIOS")
     print("="*50)
     
-    for i, test_input in enumerate(test_cases, 1):
+    # Dispatch the test cases concurrently, bounded to respect API rate limits
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def run_case(test_input: str) -> str:
+        async with semaphore:
+            return await bot.chat(test_input)
+    
+    responses = await asyncio.gather(
+        *(run_case(test_input) for test_input in test_cases),
+        return_exceptions=True
+    )
+    
+    for i, (test_input, response) in enumerate(zip(test_cases, responses), 1):
         print(f"\n--- Test Case {i} ---")
         print(f"Input: {test_input[:100]}{'...' if len(test_input) > 100 else ''}")
         
-        try:
-            response = asyncio.run(bot.chat(test_input))
+        if isinstance(response, Exception):
+            print(f"Error: {str(response)}")
+        else:
             print(f"Response: {response}")
-        except Exception as e:
-            print(f"Error: {str(e)}")
         
         print("-" * 30)
 
+# Bytes read from stdin but not yet returned as a line by ainput()
+_stdin_pending = bytearray()
+
+def _take_stdin_line():
+    """Pop the next complete line from the pending stdin bytes, or return None."""
+    end = _stdin_pending.find(b"\n")
+    if end < 0:
+        return None
+    line = bytes(_stdin_pending[:end])
+    del _stdin_pending[:end + 1]
+    return line.decode(sys.stdin.encoding or "utf-8", "surrogateescape")
+
+async def ainput(prompt: str = "") -> str:
+    """
+    Read a line from stdin without blocking the event loop.
+    
+    On POSIX the event loop watches the stdin file descriptor, so no thread
+    is left blocked on stdin at exit. Where that is not supported (Windows
+    event loops, stdin redirected from a regular file) the read falls back
+    to the loop's default executor.
+    """
+    loop = asyncio.get_running_loop()
+    print(prompt, end="", flush=True)
+    
+    line = _take_stdin_line()
+    if line is not None:
+        return line
+    
+    future = loop.create_future()
+    
+    def on_readable():
+        if future.done():
+            return
+        try:
+            data = os.read(fd, 4096)
+        except OSError as e:
+            future.set_exception(e)
+            return
+        if not data:
+            if _stdin_pending:
+                line = _stdin_pending.decode(sys.stdin.encoding or "utf-8", "surrogateescape")
+                _stdin_pending.clear()
+                future.set_result(line)
+            else:
+                future.set_exception(EOFError())
+            return
+        _stdin_pending.extend(data)
+        line = _take_stdin_line()
+        if line is not None:
+            future.set_result(line)
+    
+    try:
+        fd = sys.stdin.fileno()
+        loop.add_reader(fd, on_readable)
+    except (NotImplementedError, OSError, ValueError):
+        return await loop.run_in_executor(None, input)
+    
+    try:
+        return await future
+    finally:
+        loop.remove_reader(fd)
+
+async def interactive_chat(bot: GuardrailChatBot):
+    """Run the interactive chat loop."""
+    print("\n" + "="*50)
+    print("INTERACTIVE CHAT MODE")
+    print("Type 'quit' to exit, 'history' to see conversation history")
+    print("="*50)
+    
+    while True:
+        user_input = (await ainput("\nYou: ")).strip()
+        
+        if user_input.lower() == 'quit':
+            print("Goodbye!")
+            break
+        
+        if user_input.lower() == 'history':
+            history = bot.get_conversation_history()
+            print("\n--- Conversation History ---")
+            for entry in history[-5:]:  # Show last 5 exchanges
+                print(f"User: {entry['user']}")
+                print(f"Bot: {entry['bot']}")
+                print(f"Time: {entry['timestamp']}")
+                print("-" * 20)
+            continue
+        
+        if user_input.lower() == 'clear':
+            bot.clear_history()
+            print("Conversation history cleared.")
+            continue
+        
+        # Get response from bot
+        response = await bot.chat(user_input)
+        print(f"\nBot: {response}")
+
 def main():
     """Main function to run the guardrail chatbot."""
+    load_env()
+    
     # Get API key from environment variable
     groq_api_key = os.getenv("GROQ_API_KEY")
     
@@ -255,50 +742,27 @@ def main():
         print("You can get your API key from: https://console.groq.com/keys")
         return
     
+    # Reuse a single event loop so the LLM clients keep their connections warm
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    
     try:
-        # Initialize the chatbot
-        bot = GuardrailChatBot(groq_api_key)
+        # Initialize and warm up the chatbot
+        bot = loop.run_until_complete(GuardrailChatBot.create(groq_api_key))
         
         # Run test scenarios
-        run_test_scenarios(bot)
+        loop.run_until_complete(run_test_scenarios(bot))
         
-        # Interactive chat loop
-        print("\n" + "="*50)
-        print("INTERACTIVE CHAT MODE")
-        print("Type 'quit' to exit, 'history' to see conversation history")
-        print("="*50)
-        
-        while True:
-            user_input = input("\nYou: ").strip()
-            
-            if user_input.lower() == 'quit':
-                print("Goodbye!")
-                break
-            
-            if user_input.lower() == 'history':
-                history = bot.get_conversation_history()
-                print("\n--- Conversation History ---")
-                for entry in history[-5:]:  # Show last 5 exchanges
-                    print(f"User: {entry['user']}")
-                    print(f"Bot: {entry['bot']}")
-                    print(f"Time: {entry['timestamp']}")
-                    print("-" * 20)
-                continue
-            
-            if user_input.lower() == 'clear':
-                bot.clear_history()
-                print("Conversation history cleared.")
-                continue
-            
-            # Get response from bot
-            response = asyncio.run(bot.chat(user_input))
-            print(f"\nBot: {response}")
+        # Interactive chat loop; the event loop keeps running while waiting for input
+        loop.run_until_complete(interactive_chat(bot))
     
     except KeyboardInterrupt:
         print("\nGoodbye!")
     except Exception as e:
         logger.error(f"Application error: {str(e)}")
         print(f"Error: {str(e)}")
+    finally:
+        loop.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,78 @@
+import pytest
+
+import main
+from main import FilterEngine
+
+TOPIC = "restricted_topic"
+TOXIC = "potentially_toxic"
+
+MATCHERS = [
+    "regex",
+    pytest.param(
+        "cyac", marks=pytest.mark.skipif(main.AC is None, reason="cyac is not installed")
+    ),
+]
+
+
+@pytest.fixture(params=MATCHERS)
+def matcher(request):
+    return request.param
+
+
+def test_basic_validation(matcher):
+    engine = FilterEngine(["politics"], ["stupid"], max_length=10, matcher=matcher)
+    assert engine.classify("") == "empty_input"
+    assert engine.classify("   \n") == "empty_input"
+    assert engine.classify("x" * 11) == "input_too_long"
+    assert engine.classify("hello") == "safe"
+
+
+def test_keywords_match_case_insensitively(matcher):
+    engine = FilterEngine(["Political Party"], ["stupid"], matcher=matcher)
+    assert engine.classify("Which POLITICAL party?") == TOPIC
+    assert engine.classify("You are StUpId") == TOXIC
+
+
+def test_keyword_in_both_lists_keeps_topic_category(matcher):
+    engine = FilterEngine(["violence"], ["violence"], matcher=matcher)
+    assert engine.classify("VIOLENCE") == TOPIC
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("politics is stupid", TOPIC),
+    ("stupid politics", TOXIC),
+    # "kill" ends first, but "skills" starts first
+    ("my skills", TOPIC),
+    ("skill kill", TOXIC),
+])
+def test_mixed_categories_leftmost_keyword_wins(matcher, text, expected):
+    engine = FilterEngine(["politics", "skills"], ["stupid", "kill"], matcher=matcher)
+    assert engine.classify(text) == expected
+
+
+def test_empty_keywords_are_ignored(matcher):
+    engine = FilterEngine(["", "hack"], ["", "stupid"], matcher=matcher)
+    assert engine.classify("hello") == "safe"
+    assert engine.classify("hack") == TOPIC
+    assert engine.classify("stupid") == TOXIC
+
+
+def test_no_keywords(matcher):
+    assert FilterEngine([], [], matcher=matcher).classify("anything") == "safe"
+
+
+@pytest.mark.parametrize("text", ["You are ſtupid", "KİLL"])
+def test_unicode_case_folding_does_not_raise(matcher, text):
+    engine = FilterEngine(["politics"], ["stupid", "kill"], matcher=matcher)
+    assert engine.classify(text) in ("safe", TOXIC)
+
+
+@pytest.mark.parametrize("text", ["You are ſtupid", "KİLL"])
+def test_regex_matcher_folds_unicode_case(text):
+    engine = FilterEngine(["politics"], ["stupid", "kill"], matcher="regex")
+    assert engine.classify(text) == TOXIC
+
+
+def test_unknown_matcher_is_rejected():
+    with pytest.raises(ValueError):
+        FilterEngine([], [], matcher="trie")